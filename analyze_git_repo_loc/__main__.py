@@ -73,18 +73,14 @@ def main() -> None:
     console.print_h1(f"# Start {parser.prog}.")
     print(Style.DIM + f"- {parser.description}", end=os.linesep + os.linesep)
 
-    # Convert the since and until arguments to datetime objects
-    args.since = datetime.fromisoformat(args.since)
-    args.until = datetime.fromisoformat(args.until)
-
     # Analyze the LOC in the Git repositories
     loc_data_repositories = analyze_git_repositories(args)
     time_interval, time_period = get_time_interval_and_period(args.interval)
 
-    # Dataframe declaration
-    language_analysis = pd.DataFrame()
-    author_analysis = pd.DataFrame()
-    repository_trend_analysis = pd.DataFrame()
+    # Trend data of each repository, concatenated once after the loop
+    language_analysis_list: list[pd.DataFrame] = []
+    author_analysis_list: list[pd.DataFrame] = []
+    repository_trend_analysis_list: list[pd.DataFrame] = []
 
     # Convert analyzed data for visualization
     console.print_h1("\n# Forming dataframe type data.")
@@ -107,7 +103,7 @@ def main() -> None:
             )
             sys.exit(1)
         repository_name = next(iter(loc_data["Repository"].unique()), "Unknown")
-        repo_output_dir: Path = Path(args.output) / repository_name
+        repo_output_dir: Path = args.output / repository_name
         try:
             repo_output_dir.mkdir(parents=True, exist_ok=True)
         except OSError as ex:
@@ -115,35 +111,45 @@ def main() -> None:
 
         # 1. Stacked area trend chart of code volume by programming language per repository,
         #    bar graph of added/deleted code volume, and line graph of average code volume
-        language_analysis = analyze_trends(
-            category_column="Language",
-            interval=time_interval,
-            loc_data=loc_data,
-            analysis_data=language_analysis,
-            output_path=repo_output_dir,
+        language_analysis_list.append(
+            analyze_trends(
+                category_column="Language",
+                interval=time_interval,
+                loc_data=loc_data,
+                output_path=repo_output_dir,
+            )
         )
 
         # 2. Stacked area trend chart by author per repository
-        author_analysis = analyze_trends(
-            category_column="Author",
-            interval=time_interval,
-            loc_data=loc_data,
-            analysis_data=author_analysis,
-            output_path=repo_output_dir,
+        author_analysis_list.append(
+            analyze_trends(
+                category_column="Author",
+                interval=time_interval,
+                loc_data=loc_data,
+                output_path=repo_output_dir,
+            )
         )
 
         # 3. Stacked trend chart of code volume per repository,
         #    bar graph of added/deleted code volume, and line graph of average code volume
-        repository_trend_analysis = analyze_trends(
-            category_column="Repository",
-            interval=time_interval,
-            loc_data=loc_data,
-            analysis_data=repository_trend_analysis,
+        repository_trend_analysis_list.append(
+            analyze_trends(
+                category_column="Repository",
+                interval=time_interval,
+                loc_data=loc_data,
+            )
         )
 
+    # Concatenate the trend data of all repositories
+    language_analysis = pd.concat(language_analysis_list, ignore_index=True)
+    author_analysis = pd.concat(author_analysis_list, ignore_index=True)
+    repository_trend_analysis = pd.concat(
+        repository_trend_analysis_list, ignore_index=True
+    )
+
     # Save the analyzed data
     console.print_h1("\n# Save the analyzed data.")
-    output_dir = Path(args.output) / datetime.now().strftime("%Y%m%d%H%M%S")
+    output_dir = args.output / datetime.now().strftime("%Y%m%d%H%M%S")
     data_list = {
         "language_analysis": language_analysis,
         "author_analysis": author_analysis,
@@ -161,7 +167,7 @@ def main() -> None:
             data=language_analysis,
             category_column="Language",
             time_interval=time_interval,
-            output_path=Path(args.output),
+            output_path=args.output,
             no_plot_show=args.no_plot_show,
         )
         progress_bar.update(1)
@@ -171,7 +177,7 @@ def main() -> None:
             data=author_analysis,
             category_column="Author",
             time_interval=time_interval,
-            output_path=Path(args.output),
+            output_path=args.output,
             no_plot_show=args.no_plot_show,
         )
         progress_bar.update(1)
@@ -242,12 +248,10 @@ def prepare_trend_data(
     Returns:
         pd.DataFrame: The trend data for the trend chart.
     """
-    # Sort and group the data
-    grouped_data = (
-        data.sort_values(by=[time_interval, category_column])
-        .groupby([time_interval, category_column], as_index=False)["NLOC"]
-        .sum()
-    )
+    # Group the data (groupby sorts the group keys)
+    grouped_data = data.groupby(
+        [time_interval, category_column], as_index=False, observed=True
+    )["NLOC"].sum()
     # Calculate cumulative sum
     grouped_data["SUM"] = grouped_data.groupby(category_column)["NLOC"].cumsum()
 
@@ -306,13 +310,12 @@ def prepare_author_contribution_data(data: pd.DataFrame) -> pd.DataFrame:
     Returns:
         pd.DataFrame: The author contribution data for the trend chart.
     """
-    contribution_data = data.groupby(["Author", "Repository"], as_index=False)[
-        "NLOC"
-    ].sum()
-    # Pivot the data to create a summary with Authors as index
-    summary_data = contribution_data.pivot(
-        index="Author", columns="Repository", values="NLOC"
-    ).fillna(0)
+    # Aggregate the data and unstack it to create a summary with Authors as index
+    summary_data = (
+        data.groupby(["Author", "Repository"], observed=True)["NLOC"]
+        .sum()
+        .unstack(fill_value=0)
+    )
 
     # Sort the columns by the last value
     sorted_columns = (
@@ -321,15 +324,10 @@ def prepare_author_contribution_data(data: pd.DataFrame) -> pd.DataFrame:
         .sort_values(ascending=False)
         .index.tolist()
     )
-    # Reorder the summary_data
-    summary_data = summary_data[sorted_columns].reset_index()
     # Sort the rows by total contributions across repositories in descending order
-    summary_data["Total"] = summary_data.iloc[:, 1:].sum(axis=1)
-    summary_data = (
-        summary_data.sort_values(by="Total", ascending=False)
-        .drop(columns="Total")
-        .reset_index(drop=True)
-    )
+    sorted_authors = summary_data.sum(axis=1).sort_values(ascending=False).index
+    # Reorder the summary_data
+    summary_data = summary_data.loc[sorted_authors, sorted_columns].reset_index()
 
     return summary_data
 
@@ -360,11 +358,13 @@ def generate_trend_chart(
     chart_builder.set_strategy(ChartStrategy.TREND)
 
     # Generate trend chart for each repository
-    unique_repositories = data["Repository"].unique()
-    for repository in tqdm(
-        unique_repositories, desc="Generating trend chart", leave=False
+    repository_groups = data.groupby("Repository", sort=False, observed=True)
+    for repository, loc_data in tqdm(
+        repository_groups,
+        desc="Generating trend chart",
+        total=repository_groups.ngroups,
+        leave=False,
     ):
-        loc_data = data[data["Repository"] == repository]
         branch_name = next(iter(loc_data["Branch"].unique()), "Unknown")
 
         # LOC trend data
@@ -449,11 +449,17 @@ def save_chart_data(
                 output_path / f"{output_prefix}_summary_data.csv",
                 index=False,
             )
+        # The charts share plotly.min.js in the output directory, so that they
+        # stay small and can be viewed offline.
         if trend_chart is not None:
-            trend_chart.write_html(output_path / f"{output_prefix}_chart.html")
+            trend_chart.write_html(
+                output_path / f"{output_prefix}_chart.html",
+                include_plotlyjs="directory",
+            )
         if contribution_chart is not None:
             contribution_chart.write_html(
-                output_path / f"{output_prefix}_contribution_chart.html"
+                output_path / f"{output_prefix}_contribution_chart.html",
+                include_plotlyjs="directory",
             )
 
     except (OSError, IOError, pd.errors.EmptyDataError) as ex:
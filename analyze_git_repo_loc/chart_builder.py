@@ -23,7 +23,6 @@ from enum import Enum
 from typing import TypeVar
 
 import pandas as pd
-import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 
@@ -153,13 +152,9 @@ class ChartBuilder:
         """
         Generates a trend trace from the trend data and appends it to the chart figure.
 
-        This method creates an area plot representing the trends of lines of code (LOC)
-        by language over time using the `_trend_data` attribute. It then extracts the
-        traces from that plot and appends each trace to the first row and column of the
-        main figure maintained by this instance (`_fig`).
-
-        The plot is presumably created using Plotly Express, which is indicated by the `px`
-        prefix on the `area()` function.
+        This method creates a stacked area trace for each category of the `_trend_data`
+        attribute, representing the trends of lines of code (LOC) over time, and adds
+        it to the first row and column of the main figure maintained by this instance (`_fig`).
 
         Args:
             xaxis_column (str): The name of the column in the trend data frame that contains
@@ -186,18 +181,19 @@ class ChartBuilder:
         have traces appended to it.
         """
         # Field area plot of LOC trend
-        fig_lang = px.area(
-            data_frame=self._trend_data,
-            x=xaxis_column,
-            y=self._trend_data.columns[1:],
-            line_shape=None,
-        )
-        fig_lang_traces = []
-        for trace in range(len(fig_lang["data"])):
-            fig_lang_traces.append(fig_lang["data"][trace])
-
-        for traces in fig_lang_traces:
-            self._fig.append_trace(traces, row=1, col=1)
+        x_values = self._trend_data[xaxis_column]
+        trend_traces = [
+            go.Scatter(
+                x=x_values,
+                y=self._trend_data[column],
+                name=str(column),
+                mode="lines",
+                stackgroup="one",
+            )
+            for column in self._trend_data.columns[1:]
+        ]
+        # Add the traces in one batch, so that the figure is validated once
+        self._fig.add_traces(trend_traces, rows=1, cols=1)
 
         return self
 
@@ -206,10 +202,8 @@ class ChartBuilder:
         Creates and appends a summary line trace to the chart figure.
 
         This method uses the `_sum_data` attribute to generate a line plot with markers
-        representing the total lines of code (LOC) trend. Each trace generated from
-        `fig_sum` is then configured to not show a legend entry by setting the
-        'showlegend' property to False. The traces are collected in a list and
-        subsequently appended to the main figure's first row and column.
+        representing the total lines of code (LOC) trend. The trace does not show
+        a legend entry, and is appended to the main figure's first row and column.
 
         Args:
             xaxis_column (str): The name of the column in the summary data frame that contains
@@ -235,17 +229,9 @@ class ChartBuilder:
         traces to it.
         """
         # Line plots of total LOC trend
-        fig_sum = px.line(
-            data_frame=self._summary_data, x=xaxis_column, y="SUM", markers=True
+        return self.create_line_trace(
+            xaxis_column, yaxis_column="SUM", color="#636EFA", secondary_y=False
         )
-        for trace in fig_sum["data"]:
-            # trace["showlegend"] = False
-            trace["name"] = "SUM"
-            trace["marker"] = {"size": 8, "color": "#636EFA"}
-            trace["line"] = {"width": 2, "color": "#636EFA"}
-            self._fig.add_trace(trace, row=1, col=1, secondary_y=False)
-
-        return self
 
     def create_diff_trace(self, xaxis_column: str) -> ChartBuilderSelf:
         """
@@ -263,15 +249,41 @@ class ChartBuilder:
         Returns:
             self (ChartBuilder): Returns the instance itself for method chaining purposes.
         """
-        fig_diff = px.line(
-            data_frame=self._summary_data, x=xaxis_column, y="Diff", markers=True
+        return self.create_line_trace(
+            xaxis_column, yaxis_column="Diff", color="#EF553B", secondary_y=True
         )
-        for trace in fig_diff["data"]:
-            # trace["showlegend"] = False
-            trace["name"] = "Diff"
-            trace["marker"] = {"size": 8, "color": "#EF553B"}
-            trace["line"] = {"width": 2, "color": "#EF553B"}
-            self._fig.add_trace(trace, row=1, col=1, secondary_y=True)
+
+    def create_line_trace(
+        self, xaxis_column: str, yaxis_column: str, color: str, secondary_y: bool
+    ) -> ChartBuilderSelf:
+        """
+        Adds a line trace with markers of a summary data column to the chart figure.
+
+        This is the shared implementation of `create_sum_trace` and `create_diff_trace`.
+        The trace is named after `yaxis_column` and placed in the first row and column
+        of the subplot grid.
+
+        Args:
+            xaxis_column (str): The name of the column in the summary data frame that contains
+                                the x-axis data for the line plot.
+            yaxis_column (str): The name of the column in the summary data frame that contains
+                                the y-axis data for the line plot.
+            color (str): The color of the line and the markers.
+            secondary_y (bool): If True, the trace is placed on the secondary y-axis.
+
+        Returns:
+            self (ChartBuilder): Returns the instance itself for method chaining purposes.
+        """
+        line_trace = go.Scatter(
+            x=self._summary_data[xaxis_column],
+            y=self._summary_data[yaxis_column],
+            name=yaxis_column,
+            mode="lines+markers",
+            marker={"size": 8, "color": color},
+            line={"width": 2, "color": color},
+            showlegend=False,
+        )
+        self._fig.add_trace(line_trace, row=1, col=1, secondary_y=secondary_y)
         return self
 
     # added, deleted の棒グラフを追加するメソッド
@@ -291,25 +303,25 @@ class ChartBuilder:
         Returns:
             self (ChartBuilder): Returns the instance itself for method chaining purposes.
         """
-        fig_bar = px.bar(
-            data_frame=self._summary_data,
-            x=xaxis_column,
-            y=["Added", "Deleted"],
-            barmode="relative",
-        )
+        x_values = self._summary_data[xaxis_column]
+        bar_colors = {"Added": "rgba(0,204,150,0.6)", "Deleted": "rgba(239,85,59,0.6)"}
+        bar_traces = [
+            go.Bar(
+                x=x_values,
+                y=self._summary_data[column],
+                name=column,
+                marker={
+                    "color": bar_color,
+                    "line": {"width": 1, "color": "rgba(0,0,0,0)"},
+                },
+            )
+            for column, bar_color in bar_colors.items()
+        ]
 
         # Add the bar traces to the figure
-        for trace in fig_bar["data"]:
-            # trace["showlegend"] = False
-            self._fig.add_trace(trace, row=1, col=1, secondary_y=True)
-
-        # Update the color of the bar traces
-        added_trace, deleted_trace = self._fig.data[-2], self._fig.data[-1]
-        added_trace.marker.color = "rgba(0,204,150,0.6)"
-        deleted_trace.marker.color = "rgba(239,85,59,0.6)"
-        for trace in [added_trace, deleted_trace]:
-            trace.marker.line.width = 1
-            trace.marker.line.color = "rgba(0,0,0,0)"
+        self._fig.add_traces(
+            bar_traces, rows=1, cols=1, secondary_ys=[True] * len(bar_traces)
+        )
 
         return self
 
@@ -325,28 +337,23 @@ class ChartBuilder:
         Returns:
             self (ChartBuilder): Returns the instance itself for method chaining purposes.
         """
-        # wide dataframe to long dataframe
-        contribution_data = self._summary_data.melt(
-            id_vars=["Author"], var_name="Repository", value_name="NLOC"
-        )
-        contribution_data["NLOC"] = contribution_data["NLOC"].fillna(0)
-
-        # Create a horizontal stacked bar chart
-        fig_author = px.bar(
-            data_frame=contribution_data,
-            x="NLOC",
-            y="Author",
-            color="Repository",
-            orientation="h",
-            barmode="relative",
-        )
+        # Create a horizontal bar trace for each repository, stacked by the layout.
+        authors = self._summary_data["Author"]
+        author_traces = [
+            go.Bar(
+                x=self._summary_data[repository],
+                y=authors,
+                name=str(repository),
+                orientation="h",
+            )
+            for repository in self._summary_data.columns[1:]
+        ]
 
         # Add the bar traces to the figure
         if self._fig is None:
-            self._fig = fig_author
+            self._fig = go.Figure(data=author_traces)
         else:
-            for trace in fig_author.data:
-                self._fig.add_trace(trace)
+            self._fig.add_traces(author_traces)
 
         return self
 
@@ -11,33 +11,54 @@ Functions:
         Deletes all files located in the directory specified by the `_cache_path` attribute.
     is_branch_exists(repo_path: PathLike, branch_name: str) -> bool:
         Checks if a branch exists in the given Git repository.
+    write_commit_graph() -> None:
+        Writes the commit-graph file of the repository to speed up the history traversal.
     is_comment_or_empty_line(line: str, language: str) -> bool:
         Checks if a line is a comment or an empty line.
+    count_nloc(diff_lines: list[tuple[int, str]], language: str) -> int:
+        Counts the lines of a diff that are neither comments nor empty lines.
+    get_cache_file_name() -> str:
+        Gets the name of the cache file for the current analysis filters.
     load_cache() -> pd.DataFrame:
         Loads the cached commit data from the cache directory.
     get_commit_analysis() -> pd.DataFrame:
         Analyzes the commits in the repository and returns a DataFrame with 
         the analyzed commit data.
+    analyze_commit(commit: Commit) -> list[dict]:
+        Analyzes the modified files of a single commit.
     save_cache() -> None:
+    resolve_repo_path(repo_path: Union[Path, str]) -> Union[Path, str]:
+        Resolves the given repository path if it exists locally.
     get_repository_name(repo_path: Union[Path, str]) -> str:
     valid_language_key(languages: list[str]) -> list[str]:
 
 """
 
+import hashlib
 import os
+import shutil
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Union
+from typing import TYPE_CHECKING, Union
 
 import pandas as pd
-from git import GitCommandError, PathLike, Repo
-from pydriller import Repository
+from git import (
+    GitCommandError,
+    InvalidGitRepositoryError,
+    NoSuchPathError,
+    PathLike,
+    Repo,
+)
 from tqdm import tqdm
 
 from analyze_git_repo_loc.language_comment import LanguageComment
 from analyze_git_repo_loc.language_extensions import LanguageExtensions
 
+if TYPE_CHECKING:
+    from pydriller import Commit
+
 
 class GitRepoLOCAnalyzer:
     """
@@ -57,6 +78,7 @@ class GitRepoLOCAnalyzer:
         authors: list[str] = None,
         languages: list[str] = None,
         exclude_dirs: list[str] = None,
+        commit_graph: bool = False,
     ):
         """
         Initialize the Git repository Lines of Code (LOC) Analyzer.
@@ -73,20 +95,24 @@ class GitRepoLOCAnalyzer:
             authors (list[str]): A list of author names to filter commits.
             languages (list[str]): A list of languages to filter commits.
             exclude_dirs (list[str]): A list of directories to exclude from analysis.
+            commit_graph (bool): Whether to write the commit-graph file of a local
+                repository before traversing its history.
 
         Raises:
             OSError: If there is an error creating the cache or output directories.
         """
         # Initialize Git Repo object.
-        self._repo_path = repo_path
-        """ Git repository path """
+        self._repo_path = GitRepoLOCAnalyzer.resolve_repo_path(repo_path)
+        """ Git repository path (absolute local path, or URL of a remote repository) """
         self._branch_name = branch_name
         """ Branch name to analyze """
+        self._repository_name = GitRepoLOCAnalyzer.get_repository_name(self._repo_path)
+        """ Repository name, stored in the analyzed data """
 
         # Make output directory.
-        self._cache_path = self.make_output_dir(cache_dir / repo_path.name).resolve()
+        self._cache_path = self.make_output_dir(cache_dir / self._repository_name)
         """ Path to cache directory """
-        self._output_path = self.make_output_dir(output_dir / repo_path.name).resolve()
+        self._output_path = self.make_output_dir(output_dir / self._repository_name)
         """ Path to output directory """
 
         # pydriller options
@@ -100,17 +126,39 @@ class GitRepoLOCAnalyzer:
         """ End tag for filtering commits """
         self._authors = authors
         """ List of author names to filter commits """
-        self._languages = languages
-        """ List of languages to filter commits """
-        self._language_extensions = LanguageExtensions.get_extensions(languages)
-        """ Language extensions to filter commits """
-        self._exclude_dirs = [Path(repo_path).resolve() / d for d in exclude_dirs or []]
+        # Validated once, so that the filter in `analyze_commit` is a set lookup.
+        self._languages = (
+            set(self.valid_language_key(languages)) if languages is not None else None
+        )
+        """ Set of languages to filter commits """
+        # A remote repository is cloned to a temporary directory by pydriller,
+        # so its paths are kept relative to the repository root.
+        self._repo_root = (
+            self._repo_path if isinstance(self._repo_path, Path) else Path()
+        )
+        """ Root directory the paths of the modified files are joined to """
+        # The excluded directories are resolved once here, not per modified file.
+        self._exclude_dirs = [
+            (self._repo_root / d).resolve()
+            if self._repo_root.is_absolute()
+            else Path(d)
+            for d in exclude_dirs or []
+        ]
         """ List of directories to exclude from analysis """
 
         # Check if exclude directories exist
-        for exclude_dir in self._exclude_dirs:
-            if not exclude_dir.exists():
-                print(f"Warning: {exclude_dir} does not exist.", file=sys.stderr)
+        if self._repo_root.is_absolute():
+            for exclude_dir in self._exclude_dirs:
+                if not exclude_dir.exists():
+                    print(f"Warning: {exclude_dir} does not exist.", file=sys.stderr)
+
+        # git options
+        self._commit_graph = commit_graph
+        """ Whether to write the commit-graph file before the analysis """
+
+        # Cache file of the analyzed data
+        self._cache_file = self._cache_path / self.get_cache_file_name()
+        """ Path to the cache file, specific to the language and directory filters """
 
         # Analyzed data
         self._commit_data = None
@@ -126,11 +174,12 @@ class GitRepoLOCAnalyzer:
             output_dir (Path): The path of the directory to create.
 
         Returns:
-            Path: The path of the created directory.
+            Path: The absolute path of the created directory.
 
         Raises:
             OSError: If the directory cannot be created.
         """
+        output_dir = Path(output_dir).resolve()
         try:
             output_dir.mkdir(parents=True, exist_ok=True)
         except OSError as ex:
@@ -143,17 +192,16 @@ class GitRepoLOCAnalyzer:
         Delete all files located in the directory specified by the `_cache_path` attribute.
 
         This method checks if `_cache_path` exists and is a directory. If so,
-        it proceeds to iterate through all files within this directory (including
-        subdirectories) and deletes each file.
+        it removes the directory tree in one call and creates the empty
+        cache directory again.
 
         Raises:
             FileNotFoundError: If the cache directory does not exist.
         """
         self._cache_commit_data = None
         if self._cache_path.exists() and self._cache_path.is_dir():
-            for file in tqdm(self._cache_path.glob("**/*")):
-                if file.is_file():
-                    file.unlink()
+            shutil.rmtree(self._cache_path)
+            self.make_output_dir(self._cache_path)
 
     def is_branch_exists(self, repo_path: PathLike, branch_name: str) -> bool:
         """
@@ -172,6 +220,28 @@ class GitRepoLOCAnalyzer:
         except (GitCommandError, AttributeError):
             return False
 
+    def write_commit_graph(self) -> None:
+        """
+        Write the commit-graph file of the repository.
+
+        The commit-graph file lets git walk the history with generation numbers.
+        It is only written for a local repository that has no commit-graph file yet.
+        It is only an optimization, so errors (e.g. a path that is not a git
+        repository, or a git version without commit-graph support) are ignored.
+        """
+        if not isinstance(self._repo_path, Path) or not self._repo_path.is_dir():
+            return
+        try:
+            repo = Repo(self._repo_path)
+            objects_info = Path(repo.common_dir) / "objects" / "info"
+            if (objects_info / "commit-graph").exists() or (
+                objects_info / "commit-graphs"
+            ).exists():
+                return
+            repo.git.commit_graph("write", "--reachable")
+        except (GitCommandError, InvalidGitRepositoryError, NoSuchPathError):
+            pass
+
     @classmethod
     def is_comment_or_empty_line(cls, line: str, language: str) -> bool:
         """
@@ -188,9 +258,53 @@ class GitRepoLOCAnalyzer:
         comment_syntax = LanguageComment.get_comment_syntax(language)
         if not comment_syntax:
             return not stripped_line
-        return not stripped_line or any(
-            stripped_line.startswith(syntax) for syntax in comment_syntax
+        return not stripped_line or stripped_line.startswith(comment_syntax)
+
+    @classmethod
+    def count_nloc(cls, diff_lines: list[tuple[int, str]], language: str) -> int:
+        """
+        Count the lines of a diff that are neither comments nor empty lines.
+
+        The comment syntax of the language is looked up once for all lines.
+
+        Args:
+            diff_lines (list[tuple[int, str]]): The parsed diff lines (line_number, line).
+            language (str): The language of the code.
+
+        Returns:
+            int: The number of lines of code.
+        """
+        comment_syntax = LanguageComment.get_comment_syntax(language) or ()
+        nloc = 0
+        for _, line in diff_lines:
+            stripped_line = line.strip()
+            # Without comment syntax, only empty lines are skipped
+            if stripped_line and not stripped_line.startswith(comment_syntax):
+                nloc += 1
+        return nloc
+
+    def get_cache_file_name(self) -> str:
+        """
+        Get the name of the cache file for the current analysis filters.
+
+        The analyzed rows of a commit depend on the language and excluded directory
+        filters, so each combination of the filters has its own cache file.
+        Without filters, the name is "commit_data.pkl".
+
+        Returns:
+            str: The name of the cache file.
+        """
+        if self._languages is None and not self._exclude_dirs:
+            return "commit_data.pkl"
+
+        filter_key = "|".join(
+            [
+                ",".join(sorted(self._languages or [])),
+                ",".join(sorted(d.as_posix() for d in self._exclude_dirs)),
+            ]
         )
+        filter_hash = hashlib.sha1(filter_key.encode("utf-8")).hexdigest()[:12]
+        return f"commit_data_{filter_hash}.pkl"
 
     def load_cache(self) -> pd.DataFrame:
         """
@@ -198,12 +312,16 @@ class GitRepoLOCAnalyzer:
 
         This method reads the cached commit data from the pickle file located
         at the specified cache path. If the file does not exist, it does nothing.
+        The cached rows do not depend on the branch, so a `Branch` column of
+        an older cache file is dropped.
 
         Returns:
             pd.DataFrame: The cached commit data, if available, otherwise an empty DataFrame.
         """
         try:
-            return pd.read_pickle(self._cache_path / "commit_data.pkl")
+            return pd.read_pickle(self._cache_file).drop(
+                columns="Branch", errors="ignore"
+            )
         except (FileNotFoundError, pd.errors.EmptyDataError):
             print("No cache file found. it does nothing, and continue.")
             return None
@@ -223,6 +341,13 @@ class GitRepoLOCAnalyzer:
         Returns:
             pd.DataFrame: A DataFrame containing the analyzed commit data.
         """
+        # Imported here, so that e.g. `--help` does not load pydriller and lizard
+        from pydriller import Repository  # pylint: disable=import-outside-toplevel
+
+        # Speed up the traversal of the history
+        if self._commit_graph:
+            self.write_commit_graph()
+
         # Initialize the repository object for pydriller
         repository = Repository(
             str(self._repo_path),
@@ -232,94 +357,50 @@ class GitRepoLOCAnalyzer:
             from_tag=self._from_tag,
             to_tag=self._to_tag,
             only_authors=self._authors,
-            only_modifications_with_file_types=self._language_extensions,
+            # Languages are filtered in `analyze_commit`, since pydriller's
+            # `only_modifications_with_file_types` diffs every commit once more.
             only_no_merge=True,
             histogram_diff=True,
             num_workers=os.cpu_count(),
         )
 
-        # temporary list to store commit data
-        commit_data_list = []
         commits = list(
             tqdm(repository.traverse_commits(), desc="Getting commits", unit="commit")
         )
+        # Commit order, used to restore the order of cached and analyzed rows
+        commit_order = {commit.hash: index for index, commit in enumerate(commits)}
+
+        # Reuse the rows of the commits that are already analyzed.
+        cached_data = None
+        if self._cache_commit_data is not None:
+            cached_data = self._cache_commit_data[
+                self._cache_commit_data["Commit_hash"].isin(list(commit_order))
+            ]
+            # The cache is shared by all branches, so the rows get the analyzed branch.
+            cached_data = cached_data.assign(Branch=self._branch_name).astype(
+                {"Branch": "string"}
+            )
+            cached_hashes = set(cached_data["Commit_hash"])
+            commits = [commit for commit in commits if commit.hash not in cached_hashes]
         total_commits = len(commits)
 
-        # Traverse commits
-        for commit in tqdm(
-            commits,
-            desc="Analyzing commits",
-            total=total_commits,
-            unit="commit",
-        ):
-            commit_datetime = commit.committer_date
-            repository_name = GitRepoLOCAnalyzer.get_repository_name(self._repo_path)
-            commit_hash = commit.hash
-            commit_author = commit.author.name
-
-            # Skip if the commit is already analyzed
-            if self._cache_commit_data is not None:
-                # Check for the presence of commit_hash in the "Commit_hash" column
-                # of the cached commit data. If found, append the matching rows to
-                # the commit_data_list and continue to the next commit.
-                matching_rows = self._cache_commit_data[
-                    self._cache_commit_data["Commit_hash"] == commit_hash
-                ]
-                if not matching_rows.empty:
-                    commit_data_list.extend(matching_rows.to_dict("records"))
-                    continue
-
-            # Traverse modified files
-            for mod in commit.modified_files:
-                # Get the programming language of the modified file
-                language = LanguageExtensions.get_language(mod.filename)
-                if language == "Unknown":
-                    continue
-
-                # Skip files in excluded directories
-                if (
-                    self._exclude_dirs
-                    and mod.new_path
-                    and any(
-                        (Path(self._repo_path) / mod.new_path)
-                        .resolve()
-                        .is_relative_to(d)
-                        for d in self._exclude_dirs
+        # Analyze commits in parallel. Threads suffice, since most of the time is
+        # spent waiting on `git diff`. executor.map() keeps the commit order.
+        commit_rows: list[list[dict]] = []
+        if commits:
+            with ThreadPoolExecutor(
+                max_workers=min(total_commits, os.cpu_count() or 1)
+            ) as executor:
+                commit_rows = list(
+                    tqdm(
+                        executor.map(self.analyze_commit, commits),
+                        desc="Analyzing commits",
+                        total=total_commits,
+                        unit="commit",
                     )
-                ):
-                    continue
-
-                # Skip if the file is not in the specified language
-                if self._languages and language not in self._languages:
-                    continue
-
-                # Calculate add LOC, delete LOC, net LOC
-                # NOTE: diff_parsed is a list of tuples (line_number, line)
-                nloc_added = sum(
-                    1
-                    for _, diff in mod.diff_parsed.get("added", [])
-                    if not self.is_comment_or_empty_line(diff, language)
-                )
-                nloc_deleted = sum(
-                    1
-                    for _, diff in mod.diff_parsed.get("deleted", [])
-                    if not self.is_comment_or_empty_line(diff, language)
-                )
-                nloc = nloc_added - nloc_deleted
-
-                commit_data_list.append(
-                    {
-                        "Datetime": commit_datetime,
-                        "Repository": repository_name,
-                        "Branch": self._branch_name,
-                        "Commit_hash": commit_hash,
-                        "Author": commit_author,
-                        "Language": language,
-                        "NLOC_Added": nloc_added,
-                        "NLOC_Deleted": nloc_deleted,
-                        "NLOC": nloc,
-                    }
                 )
+        commit_data_list = [row for rows in commit_rows for row in rows]
+
         # Create DataFrame from list in a single operation
         commit_data = pd.DataFrame(
             commit_data_list,
@@ -335,27 +416,113 @@ class GitRepoLOCAnalyzer:
                 "NLOC",
             ],
         )
-        # Column type conversion
-        commit_data["Datetime"] = pd.to_datetime(commit_data["Datetime"], utc=True)
-        commit_data["Repository"] = commit_data["Repository"].astype("string")
-        commit_data["Branch"] = commit_data["Branch"].astype("string")
-        commit_data["Commit_hash"] = commit_data["Commit_hash"].astype("string")
-        commit_data["Author"] = commit_data["Author"].astype("string")
-        commit_data["Language"] = commit_data["Language"].astype("string")
-        commit_data["NLOC_Added"] = commit_data["NLOC_Added"].astype("int")
-        commit_data["NLOC_Deleted"] = commit_data["NLOC_Deleted"].astype("int")
-        commit_data["NLOC"] = commit_data["NLOC"].astype("int")
+        # Column type conversion in a single operation
+        commit_data = commit_data.astype(
+            {
+                "Repository": "string",
+                "Branch": "string",
+                "Commit_hash": "string",
+                "Author": "string",
+                "Language": "string",
+                "NLOC_Added": "int32",
+                "NLOC_Deleted": "int32",
+                "NLOC": "int32",
+            }
+        )
+        # Convert the UNIX times of the commits to UTC datetimes
+        commit_data["Datetime"] = pd.to_datetime(
+            commit_data["Datetime"], unit="s", utc=True
+        )
+
+        # Merge the cached rows, keeping the commit order
+        if cached_data is not None and not cached_data.empty:
+            commit_data = pd.concat([cached_data, commit_data], ignore_index=True)[
+                commit_data.columns
+            ]
+            commit_data = commit_data.sort_values(
+                by="Commit_hash",
+                key=lambda hashes: hashes.map(commit_order),
+                kind="stable",
+                ignore_index=True,
+            )
 
         self._commit_data = commit_data
         return commit_data
 
+    def analyze_commit(self, commit: "Commit") -> list[dict]:
+        """
+        Analyzes the modified files of a single commit.
+
+        This method is called from worker threads by `get_commit_analysis`
+        for the commits that are not cached, so it must not modify the state
+        of the instance.
+
+        Args:
+            commit (Commit): The pydriller commit to analyze.
+
+        Returns:
+            list[dict]: The analyzed rows of the commit, one per modified file.
+        """
+        commit_timestamp = int(commit.committer_date.timestamp())
+        commit_hash = commit.hash
+        commit_author = commit.author.name
+
+        commit_data_list = []
+        # Traverse modified files
+        for mod in commit.modified_files:
+            # Get the programming language of the modified file
+            language = LanguageExtensions.get_language(mod.filename)
+            if language == "Unknown":
+                continue
+
+            # Skip files in excluded directories
+            if (
+                self._exclude_dirs
+                and mod.new_path
+                and any(
+                    (self._repo_root / mod.new_path).is_relative_to(d)
+                    for d in self._exclude_dirs
+                )
+            ):
+                continue
+
+            # Skip if the file is not in the specified language
+            if self._languages is not None and language not in self._languages:
+                continue
+
+            # Calculate add LOC, delete LOC, net LOC
+            # NOTE: diff_parsed is a list of tuples (line_number, line).
+            #       pydriller parses the whole diff on every access, so it is read once.
+            diff_parsed = mod.diff_parsed
+            nloc_added = self.count_nloc(diff_parsed.get("added", []), language)
+            nloc_deleted = self.count_nloc(diff_parsed.get("deleted", []), language)
+            nloc = nloc_added - nloc_deleted
+
+            commit_data_list.append(
+                {
+                    "Datetime": commit_timestamp,
+                    "Repository": self._repository_name,
+                    "Branch": self._branch_name,
+                    "Commit_hash": commit_hash,
+                    "Author": commit_author,
+                    "Language": language,
+                    "NLOC_Added": nloc_added,
+                    "NLOC_Deleted": nloc_deleted,
+                    "NLOC": nloc,
+                }
+            )
+        return commit_data_list
+
     def save_cache(self) -> None:
         """
         Saves the commit data to a cache file.
 
         This method serializes the commit data and saves it to a pickle file
-        located at the specified cache path. If there is no commit data available,
-        it raises a ValueError.
+        located at the specified cache path. The cached rows of commits outside
+        the analyzed range are kept, and nothing is written if no new commit
+        was analyzed. The rows are stored without the `Branch` column, since
+        a commit can be analyzed from several branches. If there is no commit
+        data available, it raises a ValueError.
 
         Raises:
             ValueError: If there is no commit data to save.
@@ -363,7 +530,43 @@ class GitRepoLOCAnalyzer:
         if self._commit_data is None:
             raise ValueError("No data to save. Run get_commit_analysis() first.")
 
-        self._commit_data.to_pickle(self._cache_path / "commit_data.pkl")
+        # The analyzed rows of a commit only depend on its hash, so the rows
+        # of commits outside the current range are kept for later runs.
+        cache_data = self._commit_data.drop(columns="Branch")
+        if self._cache_commit_data is not None and not self._cache_commit_data.empty:
+            new_commit_data = cache_data[
+                ~cache_data["Commit_hash"].isin(
+                    self._cache_commit_data["Commit_hash"]
+                )
+            ]
+            # The cache file is not rewritten if every analyzed commit is cached.
+            if new_commit_data.empty:
+                return
+            cache_data = pd.concat(
+                [self._cache_commit_data, new_commit_data], ignore_index=True
+            )
+
+        cache_data.to_pickle(self._cache_file)
+        self._cache_commit_data = cache_data
+
+    @classmethod
+    def resolve_repo_path(cls, repo_path: Union[Path, str]) -> Union[Path, str]:
+        """
+        Resolves the given repository path if it exists locally.
+
+        A local path is made absolute, so that the analysis does not depend on
+        the current working directory. Anything else, e.g. the URL of a remote
+        repository, is returned unchanged.
+
+        Args:
+            repo_path (Union[Path, str]): The path or URL of the repository.
+
+        Returns:
+            Union[Path, str]: The absolute local path, or 'repo_path' as given.
+        """
+        if Path(repo_path).exists():
+            return Path(repo_path).resolve()
+        return repo_path
 
     @classmethod
     def get_repository_name(cls, repo_path: Union[Path, str]) -> str:
@@ -391,34 +594,25 @@ class GitRepoLOCAnalyzer:
         """
         Validates the language keys and returns a list of valid language keys.
 
+        The keys are matched case-insensitively against the names in
+        `LanguageExtensions.language_to_extensions`. Unknown keys are skipped
+        with a warning.
+
         Args:
             languages (list[str]): A list of language keys to validate.
 
         Returns:
             list[str]: A list of valid language keys.
         """
-
-        def capitalize_words(words: str) -> str:
-            """
-            Capitalizes the first letter of each word in a given string.
-
-            Args:
-                words (str): A string containing words separated by spaces.
-
-            Returns:
-                str: A string with the first letter of each word capitalized.
-            """
-
-            return " ".join([word.capitalize() for word in words.split()])
-
-        # Check if the language is in the language_to_extensions dictionary
+        # Map the lowercase language names to the names in the dictionary
+        language_names = {
+            name.lower(): name for name in LanguageExtensions.language_to_extensions
+        }
         valid_languages: list[str] = []
         for lang in languages:
-            if lang in LanguageExtensions.language_to_extensions:
-                valid_languages.append(lang)
-            else:
-                # if the language is not in the dictionary, capitalize the first letter of each word
-                capitalized_lang = capitalize_words(lang)
-                if capitalized_lang in LanguageExtensions.language_to_extensions:
-                    valid_languages.append(capitalized_lang)
+            language_name = language_names.get(lang.lower())
+            if language_name is None:
+                print(f"Warning: Unknown language {lang}.", file=sys.stderr)
+                continue
+            valid_languages.append(language_name)
         return valid_languages
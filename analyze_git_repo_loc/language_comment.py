@@ -5,7 +5,7 @@ Attributes:
     language_comment_syntax (dict): A dictionary that contains the comment syntax for each language.
 
 Methods:
-    get_comment_syntax(language: str) -> list[str]:
+    get_comment_syntax(language: str) -> tuple[str, ...]:
         Returns the comment syntax for the given language.
 """
 
@@ -15,73 +15,73 @@ class LanguageComment:
     LanguageComment class is a class that contains the comment syntax for each language
     """
 
-    language_comment_syntax = {
-        "C": [
+    language_comment_syntax: dict[str, tuple[str, ...]] = {
+        "C": (
             "//",
             "/*",
-        ],
-        "C++": [
+        ),
+        "C++": (
             "//",
             "/*",
-        ],
-        "C#": [
+        ),
+        "C#": (
             "//",
             "/*",
-        ],
-        "Java": [
+        ),
+        "Java": (
             "//",
             "/*",
-        ],
-        "Python": [
+        ),
+        "Python": (
             "#",
             "'''",
-        ],
-        "Ruby": [
+        ),
+        "Ruby": (
             "#",
             "=begin",
-        ],
-        "Perl": [
+        ),
+        "Perl": (
             "#",
             "=pod",
-        ],
-        "PHP": [
+        ),
+        "PHP": (
             "//",
             "/*",
-        ],
-        "JavaScript": [
+        ),
+        "JavaScript": (
             "//",
             "/*",
-        ],
-        "TypeScript": [
+        ),
+        "TypeScript": (
             "//",
             "/*",
-        ],
-        "HTML": [
+        ),
+        "HTML": (
             "<!--",
-        ],
-        "CSS": [
+        ),
+        "CSS": (
             "/*",
-        ],
-        "SQL": [
+        ),
+        "SQL": (
             "--",
-        ],
-        "Shell": [
+        ),
+        "Shell": (
             "#",
-        ],
-        "Bash": [
+        ),
+        "Bash": (
             "#",
-        ],
-        "PowerShell": [
+        ),
+        "PowerShell": (
             "#",
-        ],
-        "R": [
+        ),
+        "R": (
             "#",
-        ],
+        ),
     }
     """ comment_dict is a dictionary that contains the comment syntax for each language """
 
     @classmethod
-    def get_comment_syntax(cls, language: str) -> list[str]:
+    def get_comment_syntax(cls, language: str) -> tuple[str, ...]:
         """
         get_comment_syntax method returns the comment syntax for the given language
 
@@ -89,6 +89,6 @@ class LanguageComment:
             language (str): language name
 
         Returns:
-            list[str]: comment syntax for the given language
+            tuple[str, ...]: comment syntax for the given language
         """
         return cls.language_comment_syntax.get(language, None)
@@ -4,7 +4,6 @@ This module provides a class to get the extensions for a given language.
 Attributes:
     language_to_extensions (dict): A dictionary of languages and their extensions.
     extension_to_language (dict): A dictionary of extensions and their languages.
-    sorted_extensions (list): A list of extensions sorted by length in descending order.
     is_initialized (bool): A flag to check if the extension_to_language dictionary is initialized.
 
 Methods:
@@ -768,11 +767,6 @@ class LanguageExtensions:
     extension_to_language: dict[str, str] = {}
     """ dict: A dictionary of extensions and their languages. """
 
-    sorted_extensions: list[str] = []
-    """ list: A list of extensions sorted by length in descending order. 
-        Remark: This is used to find the longest extension that matches a filename.
-    """
-
     is_initialized: bool = False
     """ bool: A flag to check if the extension_to_language dictionary is initialized. """
 
@@ -795,9 +789,6 @@ class LanguageExtensions:
         if cls.is_initialized:
             return
         cls.extension_to_language = cls.generate_extension_to_language()
-        cls.sorted_extensions = sorted(
-            cls.extension_to_language.keys(), key=len, reverse=True
-        )
         cls.is_initialized = True
 
     @classmethod
@@ -829,10 +820,20 @@ class LanguageExtensions:
 
         Returns:
             str: The extension for the given filename.
+
+        Remark:
+            Every extension starts with a dot, so the suffixes starting at each dot
+            are looked up in `extension_to_language` from the leftmost dot.
+            The first hit is the longest matching extension.
         """
-        for ext in cls.sorted_extensions:
-            if filename.endswith(ext):
+        if not cls.is_initialized:
+            cls.initialize_extension_to_language()
+        index = filename.find(".")
+        while index != -1:
+            ext = filename[index:]
+            if ext in cls.extension_to_language:
                 return ext
+            index = filename.find(".", index + 1)
         return ""
 
     @classmethod
@@ -15,6 +15,7 @@ Functions:
 import argparse
 import sys
 import traceback
+from datetime import datetime
 from pathlib import Path
 from typing import Union
 
@@ -25,7 +26,9 @@ from analyze_git_repo_loc.colored_console_printer import ColoredConsolePrinter
 from analyze_git_repo_loc.git_repo_loc_analyzer import GitRepoLOCAnalyzer
 
 
-def parse_repos_paths(repo_paths_input: str) -> list[tuple[Path, str, list[Path]]]:
+def parse_repos_paths(
+    repo_paths_input: str,
+) -> list[tuple[Union[Path, str], str, list[Path]]]:
     """
     Parse repository paths, branches and excluded directories path from a string or file.
 
@@ -34,8 +37,8 @@ def parse_repos_paths(repo_paths_input: str) -> list[tuple[Path, str, list[Path]
             Format for each line: "repo_path#branch,/path/to/exclude1,/path/to/exclude2,..."
 
     Returns:
-       list[tuple[Path, str, list[Path]]]: A list of tuples containing:
-        - Path: Repository path
+       list[tuple[Union[Path, str], str, list[Path]]]: A list of tuples containing:
+        - Union[Path, str]: Absolute local repository path, or repository URL
         - str: Branch name
         - list[Path]: Excluded directories paths
     """
@@ -63,7 +66,7 @@ def parse_repos_paths(repo_paths_input: str) -> list[tuple[Path, str, list[Path]
         if len(parts) < 1:
             continue
         repo_and_branch = parts[0].split("#", 1)
-        repo_path = Path(repo_and_branch[0].strip())
+        repo_path = GitRepoLOCAnalyzer.resolve_repo_path(repo_and_branch[0].strip())
         branch_name = repo_and_branch[1].strip() if len(repo_and_branch) > 1 else "main"
         exclude_dirs = [Path(item.strip()) for item in parts[1:] if item.strip()]
         result.append((repo_path, branch_name, exclude_dirs))
@@ -99,8 +102,18 @@ def parse_arguments(parser: argparse.ArgumentParser) -> argparse.Namespace:
     parser.add_argument(
         "-o", "--output", type=Path, default="./out", help="Output path"
     )
-    parser.add_argument("--since", type=str, default=None, help="Start Date yyyy-mm-dd")
-    parser.add_argument("--until", type=str, default=None, help="End Date yyyy-mm-dd")
+    parser.add_argument(
+        "--since",
+        type=datetime.fromisoformat,
+        default=None,
+        help="Start Date yyyy-mm-dd",
+    )
+    parser.add_argument(
+        "--until",
+        type=datetime.fromisoformat,
+        default=None,
+        help="End Date yyyy-mm-dd",
+    )
     parser.add_argument(
         "--interval",
         choices=["daily", "weekly", "monthly"],
@@ -129,6 +142,14 @@ def parse_arguments(parser: argparse.ArgumentParser) -> argparse.Namespace:
         ),
     )
 
+    parser.add_argument(
+        "--write-commit-graph",
+        action="store_true",
+        help=(
+            "If set, the commit-graph file of each local repository is written "
+            "before the analysis to speed up the history traversal."
+        ),
+    )
     parser.add_argument(
         "--clear-cache",
         action="store_true",
@@ -210,7 +231,6 @@ def analyze_trends(
     category_column: str,
     interval: str,
     loc_data: pd.DataFrame,
-    analysis_data: pd.DataFrame,
     output_path: Path = None,
 ) -> pd.DataFrame:
     """
@@ -221,8 +241,6 @@ def analyze_trends(
         interval (str): The column name in `loc_data` representing the interval to group by.
         loc_data (pd.DataFrame): A DataFrame containing lines of code data with at least
                                  the columns specified by `category_column`, `interval`, and 'NLOC'.
-        analysis_data (pd.DataFrame): A DataFrame containing the aggregated LOC data for each group.
-                                      If None, the DataFrame will be created from scratch.
         output_path (Path): The path to save the output CSV file. If None, the file will not be saved.
 
     Returns:
@@ -230,10 +248,8 @@ def analyze_trends(
 
     """
     aggregate_functions = {
-        "Datetime": "min",
         "Repository": "first",
         "Branch": "first",
-        "Commit_hash": "first",
         "Author": "first",
         "Language": "first",
         "NLOC_Added": "sum",
@@ -241,20 +257,17 @@ def analyze_trends(
         "NLOC": "sum",
     }
     # Remove the category column from the aggregate functions.
-    # It will be used as the index in the groupby operation.
+    # It will be used as the group key in the groupby operation.
     aggregate_functions.pop(category_column, None)
-    trends_data = (
-        loc_data.groupby([interval, category_column])
-        .agg(aggregate_functions)
-        .reset_index()
+    trends_data = loc_data.groupby([interval, category_column], as_index=False).agg(
+        aggregate_functions
     )
-    trends_data.drop(columns=["Datetime", "Commit_hash"], inplace=True)
 
     if output_path is not None:
         output_prefix = category_column.lower()
         trends_data.to_csv(output_path / f"{output_prefix}_trends.csv", index=False)
 
-    return pd.concat([analysis_data, trends_data], ignore_index=True)
+    return trends_data
 
 
 def analyze_git_repositories(args: argparse.Namespace) -> list[pd.DataFrame]:
@@ -296,6 +309,7 @@ def analyze_git_repositories(args: argparse.Namespace) -> list[pd.DataFrame]:
                 authors=args.author_name,
                 languages=args.lang,
                 exclude_dirs=exclude_dirs,
+                commit_graph=args.write_commit_graph,
             )
         except OSError as ex:
             handle_exception(ex)
@@ -318,14 +332,10 @@ def analyze_git_repositories(args: argparse.Namespace) -> list[pd.DataFrame]:
         except ValueError as ex:
             handle_exception(ex)
 
-        # Create output directory for the repository
+        # Output directory for the repository, created by GitRepoLOCAnalyzer
         repo_output_dir = args.output / repository_name
-        try:
-            repo_output_dir.mkdir(parents=True, exist_ok=True)
-        except OSError as ex:
-            handle_exception(ex)
         # Save the LOC data
-        loc_data.to_csv(repo_output_dir / "loc_data.csv")
+        loc_data.to_csv(repo_output_dir / "loc_data.csv", index=False)
 
         # append loc_data to loc_data_repositories
         loc_data_repositories.append(loc_data)